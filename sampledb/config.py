@@ -324,6 +324,39 @@ def check_config(
         can_run = False
         show_config_info = True
 
+    if not isinstance(config['BACKGROUND_TASK_HANDLER_THREADS'], int) or config['BACKGROUND_TASK_HANDLER_THREADS'] <= 0:
+        print(
+            ansi_color(
+                f'Expected BACKGROUND_TASK_HANDLER_THREADS to be a positive integer, but got {config["BACKGROUND_TASK_HANDLER_THREADS"]!r}\n',
+                color=31
+            ),
+            file=sys.stderr
+        )
+        can_run = False
+        show_config_info = True
+
+    if config['MAIL_MAX_EMAILS'] is not None and (not isinstance(config['MAIL_MAX_EMAILS'], int) or config['MAIL_MAX_EMAILS'] <= 0):
+        print(
+            ansi_color(
+                f'Expected MAIL_MAX_EMAILS to be a positive integer or None, but got {config["MAIL_MAX_EMAILS"]!r}\n',
+                color=31
+            ),
+            file=sys.stderr
+        )
+        can_run = False
+        show_config_info = True
+
+    if not isinstance(config['SQLALCHEMY_ENGINE_OPTIONS'], dict):
+        print(
+            ansi_color(
+                f'Expected SQLALCHEMY_ENGINE_OPTIONS to be a dictionary, but got {config["SQLALCHEMY_ENGINE_OPTIONS"]!r}\n',
+                color=31
+            ),
+            file=sys.stderr
+        )
+        can_run = False
+        show_config_info = True
+
     if not isinstance(config['EXTRA_USER_FIELDS'], dict):
         print(
             ansi_color(
@@ -382,6 +415,22 @@ SECRET_KEY = generate_secret_key(num_bits=256)
 # deprecated and should stay disabled, as we manually add modified objects
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# options for the SQLAlchemy engine, including connection pool settings
+# see: https://docs.sqlalchemy.org/en/14/core/pooling.html
+SQLALCHEMY_ENGINE_OPTIONS = {
+    'pool_size': 20,
+    'max_overflow': 40,
+    'pool_timeout': 30,
+    # check connections when they are taken from the pool, as the
+    # database server may have closed them in the meantime
+    'pool_pre_ping': True,
+    # replace connections before typical server-side idle timeouts of 30
+    # minutes, so that pre-ping rarely finds a dead connection
+    'pool_recycle': 1500
+}
+# options set via environment variables are merged with these defaults
+_default_sqlalchemy_engine_options = SQLALCHEMY_ENGINE_OPTIONS
+
 # LDAP settings
 LDAP_NAME = None
 LDAP_SERVER = None
@@ -398,6 +447,9 @@ LDAP_PASSWORD = None
 MAIL_SERVER = None
 MAIL_SENDER = None
 CONTACT_EMAIL = None
+# maximum number of mails sent via one SMTP connection before reconnecting
+# see: https://pythonhosted.org/Flask-Mail/#configuring-flask-mail
+MAIL_MAX_EMAILS = 100
 
 # branding and legal info
 SERVICE_NAME = 'SampleDB'
@@ -488,6 +540,9 @@ ALLOW_HTTP = False
 VALID_TIME_DELTA = 300
 
 ENABLE_BACKGROUND_TASKS = False
+# sending mails is mostly waiting for the mail server, so more handler threads
+# than CPU cores may be used
+BACKGROUND_TASK_HANDLER_THREADS = 4
 
 TIMEZONE = None
 
@@ -503,7 +558,7 @@ except ValueError:
     pass
 
 # parse values as integers
-for config_name in {'MAX_CONTENT_LENGTH', 'MAX_BATCH_SIZE', 'VALID_TIME_DELTA'}:
+for config_name in {'MAX_CONTENT_LENGTH', 'MAX_BATCH_SIZE', 'VALID_TIME_DELTA', 'BACKGROUND_TASK_HANDLER_THREADS', 'MAIL_MAX_EMAILS'}:
     value = globals().get(config_name)
     if isinstance(value, str):
         try:
@@ -511,8 +566,12 @@ for config_name in {'MAX_CONTENT_LENGTH', 'MAX_BATCH_SIZE', 'VALID_TIME_DELTA'}:
         except Exception:
             pass
 
+# an empty MAIL_MAX_EMAILS value disables the limit, as Flask-Mail does for None
+if MAIL_MAX_EMAILS == '':
+    MAIL_MAX_EMAILS = None
+
 # parse values as json
-for config_name in {'SERVICE_DESCRIPTION', 'EXTRA_USER_FIELDS'}:
+for config_name in {'SERVICE_DESCRIPTION', 'EXTRA_USER_FIELDS', 'SQLALCHEMY_ENGINE_OPTIONS'}:
     value = globals().get(config_name)
     if isinstance(value, str) and value.startswith('{'):
         try:
@@ -520,6 +579,10 @@ for config_name in {'SERVICE_DESCRIPTION', 'EXTRA_USER_FIELDS'}:
         except Exception:
             pass
 
+# only override the default engine options that have been set explicitly
+if isinstance(SQLALCHEMY_ENGINE_OPTIONS, dict):
+    SQLALCHEMY_ENGINE_OPTIONS = {**_default_sqlalchemy_engine_options, **SQLALCHEMY_ENGINE_OPTIONS}
+
 # parse boolean values
 for config_name in {
     'ONLY_ADMINS_CAN_MANAGE_LOCATIONS',
@@ -31,7 +31,7 @@ def object_versions(object_id):
     object = get_object(object_id=object_id)
     if object is None:
         return flask.abort(404)
-    object_versions = get_object_versions(object_id=object_id)
+    object_versions = get_object_versions(object_id=object_id, load_data=False)
     object_versions.sort(key=lambda object_version: -object_version.version_id)
     return flask.render_template('objects/object_versions.html', get_user=get_user_if_exists, object=object, object_versions=object_versions)
 
@@ -1,15 +1,17 @@
 
 from . import core
 from . import send_mail
-from .core import start_handler_threads, stop_handler_threads, post_background_task, get_background_tasks
-from .send_mail import post_send_mail_task
+from .core import start_handler_threads, stop_handler_threads, post_background_task, post_background_task_batch, get_background_tasks
+from .send_mail import post_send_mail_task, post_send_mail_task_batch
 
 __all__ = [
     'core',
     'send_mail',
     'post_send_mail_task',
+    'post_send_mail_task_batch',
     'start_handler_threads',
     'stop_handler_threads',
     'post_background_task',
+    'post_background_task_batch',
     'get_background_tasks',
 ]
@@ -21,10 +21,9 @@ import flask
 from ... import db
 from ...models import BackgroundTask, BackgroundTaskStatus
 from .. import errors
-from .send_mail import handle_send_mail_task
+from .send_mail import handle_send_mail_task, close_mail_connection
 
 TASK_WAIT_TIMEOUT = 30
-NUM_HANDLER_THREADS = 4
 
 HANDLERS = {
     'send_mail': handle_send_mail_task
@@ -82,13 +81,51 @@ def post_background_task(
         return _handle_background_task(type, data), None
 
 
+def post_background_task_batch(
+        type: str,
+        data_sequence: typing.Sequence[typing.Dict[str, typing.Any]],
+        auto_delete: bool = True
+) -> typing.List[typing.Tuple[BackgroundTaskStatus, typing.Optional[BackgroundTask]]]:
+    """
+    Create a batch of background tasks of the same type and post them to be
+    performed.
+
+    This behaves like calling post_background_task for each entry in the data
+    sequence, but the tasks are stored in the database together, so it should
+    be used when posting many tasks at once.
+
+    :param type: the type of the tasks
+    :param data_sequence: a sequence containing the data for each task
+    :param auto_delete: whether the tasks should be deleted automatically,
+        once they are done or have failed
+    :return: the status and task object for each task
+    """
+    if flask.current_app.config['ENABLE_BACKGROUND_TASKS']:
+        tasks = [
+            BackgroundTask(
+                type=type,
+                auto_delete=auto_delete,
+                data=data,
+                status=BackgroundTaskStatus.POSTED
+            )
+            for data in data_sequence
+        ]
+        db.session.add_all(tasks)
+        db.session.commit()
+        wake_event.set()
+        start_handler_threads(flask.current_app)
+        return [(BackgroundTaskStatus.POSTED, task) for task in tasks]
+    else:
+        return [(_handle_background_task(type, data), None) for data in data_sequence]
+
+
 def start_handler_threads(app):
     """
     Start handler threads for background tasks.
 
     This function first cleans up all dead threads, then creates and starts
-    handler threads until the desired number of handler threads has been
-    reached.
+    handler threads until the number of handler threads set in the
+    BACKGROUND_TASK_HANDLER_THREADS configuration value has been reached.
 
     If background tasks are disabled, this function returns immediately.
     """
@@ -105,7 +142,7 @@ def start_handler_threads(app):
         app = app._get_current_object()
     # use daemon threads during testing, as a failed test may circumvent the thread stop signal
     daemon = app.config.get('TESTING', False)
-    while len(handler_threads) < NUM_HANDLER_THREADS:
+    while len(handler_threads) < app.config['BACKGROUND_TASK_HANDLER_THREADS']:
         handler_thread = threading.Thread(target=_handle_background_tasks, args=[app], daemon=daemon)
         handler_thread.start()
         handler_threads.append(handler_thread)
@@ -157,6 +194,8 @@ def _handle_background_tasks(app):
             else:
                 wake_event.clear()
                 wake_event.wait(TASK_WAIT_TIMEOUT)
+        # handlers may keep connections open, which need to be closed by the thread that opened them
+        close_mail_connection()
 
 
 def _claim_background_task(
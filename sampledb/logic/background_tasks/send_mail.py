@@ -1,5 +1,6 @@
-
 import smtplib
+import threading
+import time
 import typing
 
 import flask
@@ -9,6 +10,9 @@ from ... import mail
 from . import core
 from ...models import BackgroundTask, BackgroundTaskStatus
 
+# each handler thread keeps its own SMTP connection open between tasks
+_connection_holder = threading.local()
+
 
 def post_send_mail_task(
         subject: str,
@@ -29,17 +33,146 @@ def post_send_mail_task(
     )
 
 
+def post_send_mail_task_batch(
+        mails: typing.Sequence[typing.Dict[str, typing.Any]],
+        auto_delete: bool = True
+) -> typing.List[typing.Tuple[BackgroundTaskStatus, typing.Optional[BackgroundTask]]]:
+    """
+    Post a batch of send_mail tasks at once.
+
+    :param mails: a sequence of dicts, each containing the subject,
+        recipients, text and html for one mail
+    :param auto_delete: whether the tasks should be deleted automatically
+    :return: the status and task object for each mail
+    """
+    return core.post_background_task_batch(
+        type='send_mail',
+        data_sequence=[
+            {
+                'subject': mail_data['subject'],
+                'recipients': mail_data['recipients'],
+                'text': mail_data['text'],
+                'html': mail_data['html']
+            }
+            for mail_data in mails
+        ],
+        auto_delete=auto_delete
+    )
+
+
+def _get_mail_connection() -> flask_mail.Connection:
+    """
+    Get the SMTP connection for the current thread, connecting if necessary.
+
+    :return: an open mail connection
+    """
+    connection = getattr(_connection_holder, 'connection', None)
+    if connection is not None:
+        mail_state = flask.current_app.extensions['mail']
+        is_disconnected = connection.host is not None and connection.host.sock is None
+        if connection.mail is not mail_state or is_disconnected:
+            close_mail_connection()
+            connection = None
+    if connection is None:
+        connection = mail.connect()
+        connection.__enter__()
+        _connection_holder.connection = connection
+    return connection
+
+
+def close_mail_connection() -> None:
+    """
+    Close the SMTP connection of the current thread, if there is one.
+    """
+    connection = getattr(_connection_holder, 'connection', None)
+    _connection_holder.connection = None
+    if connection is None:
+        return
+    try:
+        connection.__exit__(None, None, None)
+    except smtplib.SMTPException:
+        # the connection might already have been closed by the server
+        pass
+
+
+def _is_lost_connection_error(error: smtplib.SMTPException) -> bool:
+    """
+    Return whether an SMTP error means that the connection has been lost.
+
+    Servers may close idle connections with a 421 reply, which smtplib only
+    reads as the reply to the next command.
+
+    :param error: the error raised while sending a message
+    :return: whether the message may be sent again using a new connection
+    """
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return any(code == 421 for code, _ in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code == 421
+
+
+def _send_message(message: flask_mail.Message) -> None:
+    """
+    Send a message using the SMTP connection of the current thread.
+
+    :param message: the message to send
+    """
+    # this replicates flask_mail.Connection.send from the pinned Flask-Mail
+    # 0.9.1, which cannot be used here as it reconnects after delivering a
+    # message once max_emails is reached, so that errors during the
+    # reconnect would be indistinguishable from errors during delivery
+    assert message.send_to, "No recipients have been added"
+    assert message.sender, "The message does not specify a sender"
+    if message.has_bad_headers():
+        raise flask_mail.BadHeaderError()
+    if message.date is None:
+        message.date = time.time()
+    connection = _get_mail_connection()
+    if connection.host is not None:
+        sendmail_args = (
+            flask_mail.sanitize_address(message.sender),
+            list(flask_mail.sanitize_addresses(message.send_to)),
+            message.as_bytes(),
+            message.mail_options,
+            message.rcpt_options
+        )
+        try:
+            connection.host.sendmail(*sendmail_args)
+        except smtplib.SMTPException as error:
+            if not _is_lost_connection_error(error):
+                raise
+            # the cached connection might have timed out before the message
+            # was delivered, so reconnect and retry once
+            close_mail_connection()
+            connection = _get_mail_connection()
+            connection.host.sendmail(*sendmail_args)
+    # Flask-Mail's record_messages relies on this signal
+    flask_mail.email_dispatched.send(message, app=flask.current_app._get_current_object())
+    connection.num_emails += 1
+    if connection.num_emails == connection.mail.max_emails:
+        # the message has already been delivered, so the connection is only
+        # closed here and a new one will be opened for the next message
+        close_mail_connection()
+
+
 def handle_send_mail_task(
         data: typing.Dict[str, typing.Any]
 ) -> bool:
+    message = flask_mail.Message(
+        subject=data['subject'],
+        sender=flask.current_app.config['MAIL_SENDER'],
+        recipients=data['recipients'],
+        body=data['text'],
+        html=data['html']
+    )
     try:
-        mail.send(flask_mail.Message(
-            subject=data['subject'],
-            sender=flask.current_app.config['MAIL_SENDER'],
-            recipients=data['recipients'],
-            body=data['text'],
-            html=data['html']
-        ))
+        if not flask.current_app.config['ENABLE_BACKGROUND_TASKS']:
+            # tasks are handled synchronously, so there is no handler thread
+            # that could keep the connection open
+            mail.send(message)
+        else:
+            _send_message(message)
         return True
     except smtplib.SMTPRecipientsRefused:
         return False
@@ -64,6 +64,27 @@ def _store_new_log_entry(type: ObjectLogEntryType, object_id: int, user_id: int,
     db.session.commit()
 
 
+def _store_new_log_entries(type: ObjectLogEntryType, object_ids: typing.Sequence[int], user_id: int, data: dict):
+    if not object_ids:
+        return
+    utc_datetime = datetime.datetime.utcnow()
+    # use a single multi-row insert instead of adding one ORM instance per entry
+    db.session.execute(
+        ObjectLogEntry.__table__.insert(),
+        [
+            {
+                'type': type,
+                'object_id': object_id,
+                'user_id': user_id,
+                'data': data,
+                'utc_datetime': utc_datetime
+            }
+            for object_id in object_ids
+        ]
+    )
+    db.session.commit()
+
+
 def create_object(user_id: int, object_id: int, previous_object_id: typing.Optional[int] = None):
     data = {}
     if previous_object_id:
@@ -110,6 +131,17 @@ def use_object_in_measurement(user_id: int, object_id: int, measurement_id: int)
     )
 
 
+def use_objects_in_measurement(user_id: int, object_ids: typing.Sequence[int], measurement_id: int):
+    _store_new_log_entries(
+        type=ObjectLogEntryType.USE_OBJECT_IN_MEASUREMENT,
+        object_ids=object_ids,
+        user_id=user_id,
+        data={
+            'measurement_id': measurement_id
+        }
+    )
+
+
 def use_object_in_sample(user_id: int, object_id: int, sample_id: int):
     _store_new_log_entry(
         type=ObjectLogEntryType.USE_OBJECT_IN_SAMPLE_CREATION,
@@ -121,6 +153,17 @@ def use_object_in_sample(user_id: int, object_id: int, sample_id: int):
     )
 
 
+def use_objects_in_sample(user_id: int, object_ids: typing.Sequence[int], sample_id: int):
+    _store_new_log_entries(
+        type=ObjectLogEntryType.USE_OBJECT_IN_SAMPLE_CREATION,
+        object_ids=object_ids,
+        user_id=user_id,
+        data={
+            'sample_id': sample_id
+        }
+    )
+
+
 def post_comment(user_id: int, object_id: int, comment_id: int):
     _store_new_log_entry(
         type=ObjectLogEntryType.POST_COMMENT,
@@ -195,6 +238,17 @@ def reference_object_in_metadata(user_id: int, object_id: int, referencing_objec
     )
 
 
+def reference_objects_in_metadata(user_id: int, object_ids: typing.Sequence[int], referencing_object_id: int):
+    _store_new_log_entries(
+        type=ObjectLogEntryType.REFERENCE_OBJECT_IN_METADATA,
+        object_ids=object_ids,
+        user_id=user_id,
+        data={
+            'object_id': referencing_object_id
+        }
+    )
+
+
 def export_to_dataverse(user_id: int, object_id: int, dataverse_url: str):
     _store_new_log_entry(
         type=ObjectLogEntryType.EXPORT_TO_DATAVERSE,
@@ -66,7 +66,7 @@ def create_object(
         raise
     object_log.create_object(object_id=object.object_id, user_id=user_id, previous_object_id=previous_object_id)
     user_log.create_object(object_id=object.object_id, user_id=user_id)
-    _update_object_references(object, user_id=user_id)
+    _update_object_references(object, user_id=user_id, action_type_id=action.type_id)
     _send_user_references_notifications(object, user_id)
     if copy_permissions_object_id is not None:
         object_permissions.copy_permissions(object.id, copy_permissions_object_id)
@@ -150,7 +150,7 @@ def create_object_batch(
         user ID exists
     """
     objects = []
-    actions.get_action(action_id)
+    action = actions.get_action(action_id)
     users.get_user(user_id)
     try:
         for data in data_sequence:
@@ -166,7 +166,7 @@ def create_object_batch(
             user_log.create_batch(user_id=user_id, batch_object_ids=batch_object_ids)
             for object in objects:
                 object_log.create_batch(object_id=object.object_id, user_id=user_id, batch_object_ids=batch_object_ids)
-                _update_object_references(object, user_id=user_id)
+                _update_object_references(object, user_id=user_id, action_type_id=action.type_id)
                 _send_user_references_notifications(object, user_id)
                 if copy_permissions_object_id is not None:
                     object_permissions.copy_permissions(object.id, copy_permissions_object_id)
@@ -313,16 +313,18 @@ def get_fed_object(fed_object_id: int, component_id: int, fed_version_id: typing
     return object
 
 
-def get_object_versions(object_id: int) -> typing.List[Object]:
+def get_object_versions(object_id: int, load_data: bool = True) -> typing.List[Object]:
     """
     Returns all versions of an object, sorted from oldest to newest.
 
     :param object_id: the ID of the existing object
+    :param load_data: whether to load the data and schema of the versions.
+        If False, these will be None, e.g. for listing the version history.
     :return: the object versions
     :raise errors.ObjectDoesNotExistError: when no object with the given
         object ID exists
     """
-    object_versions = Objects.get_object_versions(object_id=object_id)
+    object_versions = Objects.get_object_versions(object_id=object_id, load_data=load_data)
     if not object_versions:
         raise errors.ObjectDoesNotExistError()
     return object_versions
@@ -346,30 +348,101 @@ def get_objects(filter_func=lambda data: True, action_filter=None, **kwargs) ->
     return Objects.get_current_objects(filter_func=filter_func, action_table=action_table, action_filter=action_filter, **kwargs)
 
 
-def _get_object_properties(object: Object) -> typing.List[typing.Tuple[typing.List[str], dict, dict]]:
+def get_objects_iter(filter_func=lambda data: True, action_filter=None, batch_size: int = 500, **kwargs) -> typing.Iterator[Object]:
+    """
+    Iterates over all objects, optionally after filtering the objects by their
+    data or by their actions' information.
+
+    In contrast to get_objects, the objects are fetched from the database in
+    batches while iterating, so this function should be used when processing
+    large numbers of objects one after another.
+
+    :param filter_func: a lambda that may return an SQLAlchemy filter when
+        given the object table's data column
+    :param action_filter: a SQLAlchemy comparator, used to query only objects
+        created by specific actions
+    :param batch_size: the number of objects to fetch at a time
+    :return: an iterator over all objects or those matching the given filters
+    """
+    if action_filter is None:
+        action_table = None
+    else:
+        action_table = Action.__table__
+    return Objects.iter_current_objects(filter_func=filter_func, action_table=action_table, action_filter=action_filter, batch_size=batch_size, **kwargs)
+
+
+def _get_object_properties(
+        object: Object,
+        type_filter: typing.Optional[typing.Collection[str]] = None
+) -> typing.Iterator[typing.Tuple[typing.List[typing.Union[str, int]], dict, typing.Any]]:
     """
-    Returns a list of all properties of an object, as 3-tuples consisting of
+    Iterates over all properties of an object, as 3-tuples consisting of
     the path to the property, its schema and the actual data.
 
     :param object: the object
-    :return: a list of one 3-tuples for reach of the object's properties
+    :param type_filter: the property types to yield, or None to yield all
+    :return: an iterator yielding one 3-tuple for each of the object's properties
     """
-    def iter_object_properties(previous_path, schema, data):
+    # explicit stack instead of recursion, with children pushed in reverse
+    # order so that properties are yielded in depth-first order
+    stack = [([], object.schema, object.data)]
+    while stack:
+        path, schema, data = stack.pop()
         if schema is None or data is None:
-            return
-        if schema['type'] == 'object':
-            for property_name in schema['properties']:
-                if property_name in data:
-                    for property in iter_object_properties(previous_path + [property_name], schema['properties'][property_name], data[property_name]):
-                        yield property
-        elif schema['type'] == 'array':
-            for index, item in enumerate(data):
-                for property in iter_object_properties(previous_path + [index], schema['items'], item):
-                    yield property
-        else:
-            yield previous_path, schema, data
-
-    return list(iter_object_properties([], object.schema, object.data))
+            continue
+        schema_type = schema['type']
+        if schema_type == 'object':
+            properties = schema['properties']
+            stack.extend(
+                (path + [property_name], properties[property_name], data[property_name])
+                for property_name in reversed(list(properties))
+                if property_name in data
+            )
+        elif schema_type == 'array':
+            item_schema = schema['items']
+            stack.extend(
+                (path + [index], item_schema, data[index])
+                for index in reversed(range(len(data)))
+            )
+        elif type_filter is None or schema_type in type_filter:
+            yield path, schema, data
+
+
+def _get_previous_object_version_data_at_paths(
+        object: Object,
+        paths: typing.Sequence[typing.Sequence[typing.Union[str, int]]]
+) -> typing.List[typing.Any]:
+    """
+    Returns the data of the previous version of an object at the given paths.
+
+    The complete data of the previous version is loaded once, without its
+    schema, and the paths are looked up in it.
+
+    :param object: the object, with a version ID greater than 0
+    :param paths: the paths into the object data
+    :return: a list with the previous data at each path, or None for paths
+        that did not exist in the previous version
+    :raise errors.ObjectDoesNotExistError: when the object does not exist
+    :raise errors.ObjectVersionDoesNotExistError: when the object does not
+        have a previous version
+    """
+    previous_data = Objects.get_object_version_data(object_id=object.object_id, version_id=object.version_id - 1)
+    if previous_data is None:
+        # either raise the matching error or use the version without data
+        previous_data = get_object(object.object_id, object.version_id - 1).data
+    previous_data_at_paths = []
+    for path in paths:
+        data = previous_data
+        for path_element in path:
+            if isinstance(data, dict) and path_element in data:
+                data = data[path_element]
+            elif isinstance(data, list) and isinstance(path_element, int) and 0 <= path_element < len(data):
+                data = data[path_element]
+            else:
+                data = None
+                break
+        previous_data_at_paths.append(data)
+    return previous_data_at_paths
 
 
 def find_object_references(
@@ -385,8 +458,10 @@ def find_object_references(
         previous referenced object ids
     """
     referenced_object_ids = []
-    for path, schema, data in _get_object_properties(object):
-        if schema['type'] in ('sample', 'measurement', 'object_reference') and data and data.get('object_id'):
+    # indices of referenced_object_ids and paths to look up in the previous version
+    previous_data_lookups = []
+    for path, schema, data in _get_object_properties(object, type_filter=('sample', 'measurement', 'object_reference')):
+        if data and data.get('object_id'):
             if 'component_uuid' in data and data['component_uuid'] != flask.current_app.config['FEDERATION_UUID']:
                 try:
                     component = get_component_by_uuid(data['component_uuid'])
@@ -412,21 +487,18 @@ def find_object_references(
                     referenced_object_id = data['object_id']
                 previous_referenced_object_id = None
                 if find_previous_referenced_object_ids and object.version_id > 0:
-                    previous_object_version = get_object(object.object_id, object.version_id - 1)
-                    previous_data = previous_object_version.data
-                    try:
-                        for path_element in path:
-                            previous_data = previous_data[path_element]
-                    except (KeyError, IndexError):
-                        pass
-                    else:
-                        if previous_data is not None and 'object_id' in previous_data and previous_data['object_id'] is not None:
-                            previous_referenced_object_id = previous_data['object_id']
+                    previous_data_lookups.append((len(referenced_object_ids), path))
             referenced_object_ids.append((referenced_object_id, previous_referenced_object_id, schema['type']))
+    if previous_data_lookups:
+        previous_data_at_paths = _get_previous_object_version_data_at_paths(object, [path for _, path in previous_data_lookups])
+        for (index, _), previous_data in zip(previous_data_lookups, previous_data_at_paths):
+            if isinstance(previous_data, dict) and previous_data.get('object_id') is not None:
+                referenced_object_id, _, schema_type = referenced_object_ids[index]
+                referenced_object_ids[index] = (referenced_object_id, previous_data['object_id'], schema_type)
     return referenced_object_ids
 
 
-def _update_object_references(object: Object, user_id: int) -> None:
+def _update_object_references(object: Object, user_id: int, action_type_id: typing.Optional[int] = None) -> None:
     """
     Searches for references to other objects and updates these accordingly.
 
@@ -436,16 +508,26 @@ def _update_object_references(object: Object, user_id: int) -> None:
 
     :param object: the updated (or newly created) object
     :param user_id: the user who caused the object update or creation
+    :param action_type_id: the ID of the object's action type, if it is
+        already known to the caller
     """
-    action_type_id = actions.get_action(object.action_id).type_id
+    if action_type_id is None:
+        action_type_id = actions.get_action(object.action_id).type_id
+    # collect the log entries to store them using one statement per entry type
+    used_in_measurement_object_ids = []
+    used_in_sample_object_ids = []
+    referenced_in_metadata_object_ids = []
     for referenced_object_id, previous_referenced_object_id, schema_type in find_object_references(object):
         if referenced_object_id != previous_referenced_object_id:
             if action_type_id == ActionType.MEASUREMENT and schema_type == 'sample':
-                object_log.use_object_in_measurement(object_id=referenced_object_id, user_id=user_id, measurement_id=object.object_id)
+                used_in_measurement_object_ids.append(referenced_object_id)
             elif action_type_id == ActionType.SAMPLE_CREATION and schema_type == 'sample':
-                object_log.use_object_in_sample(object_id=referenced_object_id, user_id=user_id, sample_id=object.object_id)
+                used_in_sample_object_ids.append(referenced_object_id)
             else:
-                object_log.reference_object_in_metadata(object_id=referenced_object_id, user_id=user_id, referencing_object_id=object.object_id)
+                referenced_in_metadata_object_ids.append(referenced_object_id)
+    object_log.use_objects_in_measurement(object_ids=used_in_measurement_object_ids, user_id=user_id, measurement_id=object.object_id)
+    object_log.use_objects_in_sample(object_ids=used_in_sample_object_ids, user_id=user_id, sample_id=object.object_id)
+    object_log.reference_objects_in_metadata(object_ids=referenced_in_metadata_object_ids, user_id=user_id, referencing_object_id=object.object_id)
 
 
 def _send_user_references_notifications(object: Object, user_id: int) -> None:
@@ -470,20 +552,19 @@ def find_user_references(object: Object, find_previous_referenced_user_ids: bool
         previous referenced user ids
     """
     referenced_user_ids = []
-    for path, schema, data in _get_object_properties(object):
-        if schema['type'] == 'user' and data is not None and data['user_id'] is not None:
+    # indices of referenced_user_ids and paths to look up in the previous version
+    previous_data_lookups = []
+    for path, schema, data in _get_object_properties(object, type_filter=('user',)):
+        if data is not None and data['user_id'] is not None:
             referenced_user_id = data['user_id']
             previous_referenced_user_id = None
             if find_previous_referenced_user_ids and object.version_id > 0:
-                previous_object_version = get_object(object.object_id, object.version_id - 1)
-                previous_data = previous_object_version.data
-                try:
-                    for path_element in path:
-                        previous_data = previous_data[path_element]
-                except (KeyError, IndexError):
-                    pass
-                else:
-                    if previous_data is not None and 'user_id' in previous_data and previous_data['user_id'] is not None:
-                        previous_referenced_user_id = previous_data['user_id']
+                previous_data_lookups.append((len(referenced_user_ids), path))
             referenced_user_ids.append((referenced_user_id, previous_referenced_user_id))
+    if previous_data_lookups:
+        previous_data_at_paths = _get_previous_object_version_data_at_paths(object, [path for _, path in previous_data_lookups])
+        for (index, _), previous_data in zip(previous_data_lookups, previous_data_at_paths):
+            if isinstance(previous_data, dict) and previous_data.get('user_id') is not None:
+                referenced_user_id, _ = referenced_user_ids[index]
+                referenced_user_ids[index] = (referenced_user_id, previous_data['user_id'])
     return referenced_user_ids
@@ -5,16 +5,18 @@
 
 import logging
 
-from .utils import find_migrations, should_skip_by_index, update_migration_index
+from .utils import find_migrations, get_migration_index, should_skip_by_index, update_migration_index
 
 
 def run(db):
     logger = logging.getLogger('sampledb.migrations')
+    # the migration index is read once instead of querying it for every migration
+    migration_index = None
     for index, name, function in find_migrations():
         logger.info('Migration #{} "{}":'.format(index, name))
 
         # Skip migration by migration index
-        if should_skip_by_index(db, index):
+        if should_skip_by_index(migration_index, index):
             logger.info("Skipped (index).")
             continue
 
@@ -31,3 +33,9 @@ def run(db):
         except Exception:
             db.session.rollback()
             raise
+
+        if migration_index is None:
+            # the migration_index table exists once migration 0 has been performed
+            migration_index = get_migration_index(db)
+        else:
+            migration_index = max(migration_index, index)
@@ -20,26 +20,14 @@ def run(db):
         return False
 
     # Perform migration
-    default_public_permissions = db.session.execute("""
-        SELECT creator_id
+    db.session.execute("""
+        INSERT INTO all_user_default_permissions
+        (creator_id, permissions)
+        SELECT creator_id, 'READ'
         FROM default_public_permissions
         WHERE is_public = true
-    """).fetchall()
-    all_user_default_permissions = db.session.execute("""
-        SELECT creator_id, permissions
-        FROM all_user_default_permissions
-    """).fetchall()
-    all_user_object_permissions = {
-        creator_id: permissions
-        for creator_id, permissions in all_user_default_permissions
-    }
-    for creator_id, in default_public_permissions:
-        if creator_id not in all_user_object_permissions:
-            db.session.execute("""
-                INSERT INTO all_user_default_permissions
-                (creator_id, permissions)
-                VALUES (:creator_id, 'READ')
-            """, {'creator_id': creator_id})
+        ON CONFLICT (creator_id) DO NOTHING
+    """)
     db.session.execute("""
         DROP TABLE default_public_permissions
     """)
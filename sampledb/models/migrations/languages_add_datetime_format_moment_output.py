@@ -11,12 +11,12 @@ MIGRATION_NAME, _ = os.path.splitext(os.path.basename(__file__))
 
 def run(db):
     # Skip migration by condition
-    languages_column_names = db.session.execute("""
+    column_exists = db.session.execute("""
         SELECT column_name
         FROM information_schema.columns
-        WHERE table_name = 'languages'
+        WHERE table_name = 'languages' AND column_name = 'datetime_format_moment_output'
     """).fetchall()
-    if ('datetime_format_moment_output',) in languages_column_names:
+    if column_exists:
         return False
 
     # Perform migration
@@ -26,12 +26,10 @@ def run(db):
     """)
     db.session.execute("""
         UPDATE languages
-        SET datetime_format_moment_output = 'MMM D, YYYY, h:mm:ss A'
-        WHERE id = -99
-    """)
-    db.session.execute("""
-        UPDATE languages
-        SET datetime_format_moment_output = 'DD.MM.YYYY HH:mm:ss'
-        WHERE id = -98
+        SET datetime_format_moment_output = CASE id
+            WHEN -99 THEN 'MMM D, YYYY, h:mm:ss A'
+            WHEN -98 THEN 'DD.MM.YYYY HH:mm:ss'
+        END
+        WHERE id IN (-99, -98)
     """)
     return True
@@ -8,27 +8,38 @@ import os
 import typing
 
 
-def should_skip_by_index(db: typing.Any, index: int) -> bool:
+def get_migration_index(db: typing.Any) -> int:
     """
-    Returns whether or not a migration should be skipped due to its index.
+    Returns the database's current migration index.
+
+    This requires the migration_index table, which is created by migration 0.
 
     :param db: the database
+    :return: the current migration index
+    """
+    return db.session.execute(
+        """
+        SELECT MAX(migration_index)
+        FROM migration_index
+        """
+    ).scalar()
+
+
+def should_skip_by_index(migration_index: typing.Optional[int], index: int) -> bool:
+    """
+    Returns whether or not a migration should be skipped due to its index.
+
+    :param migration_index: the database's current migration index, or None
+        if it has not been read yet
     :param index: the migration index to check
     :return: whether or not the migration should be skipped
     """
     # migration 0 creates the migration_index table, so it cannot be skipped
     # by index as the table might not exist yet
-    if index == 0:
+    if index == 0 or migration_index is None:
         return False
 
-    return db.session.execute(
-        """
-        SELECT migration_index
-        FROM migration_index
-        WHERE migration_index >= :index
-        """,
-        {'index': index}
-    ).first() is not None
+    return migration_index >= index
 
 
 def update_migration_index(db: typing.Any, index: int) -> None:
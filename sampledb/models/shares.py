@@ -19,7 +19,7 @@ class ObjectShare(db.Model):
     component_id = db.Column(db.Integer, db.ForeignKey(Component.id), nullable=False, primary_key=True)
     policy = db.Column(postgresql.JSONB, nullable=False)
     utc_datetime = db.Column(db.DateTime, nullable=False)
-    component = db.relationship('Component')
+    component = db.relationship('Component', lazy='selectin')
 
     def __init__(self, object_id: int, component_id: int, policy: dict, utc_datetime: typing.Optional[datetime.datetime] = None):
         self.object_id = object_id
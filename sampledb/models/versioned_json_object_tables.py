@@ -682,27 +682,17 @@ class VersionedJSONSerializableObjectTables(object):
             return current_object
         return None
 
-    def get_current_objects(self, filter_func=lambda data: True, action_table=None, action_filter=None, connection=None, table=None, parameters=None, sorting_func=None, limit=None, offset=None, num_objects_found=None):
+    def _get_current_objects_select_statement(self, filter_func, action_table, action_filter, table, sorting_func, limit, offset, include_count):
         """
-        Queries and returns all objects matching a given filter.
+        Builds the select statement used for querying current objects.
 
-        :param filter_func: a lambda that may return an SQLAlchemy filter when given a table
-        :param action_filter: a SQLAlchemy comparator, used to query only objects created by specific actions
-        :param connection: the SQLAlchemy connection (optional, defaults to a new connection using self.bind)
-        :param table: a custom SQLAlchemy table-like object to use as base for the query (optional)
-        :param parameters: query parameters for the custom select statement (optional)
-        :return: a list of objects as object_type
+        :param include_count: whether to include the total number of matching objects as an additional last column
+        :return: the select statement
         """
-        if connection is None:
-            connection = self.bind.connect()
-
-        if parameters is None:
-            parameters = {}
-
         if table is None:
             table = self._current_table
 
-        select_statement = db.select([
+        columns = [
             table.c.object_id,
             table.c.version_id,
             table.c.action_id,
@@ -712,9 +702,11 @@ class VersionedJSONSerializableObjectTables(object):
             table.c.utc_datetime,
             table.c.fed_object_id,
             table.c.fed_version_id,
-            table.c.component_id,
-            db.sql.expression.text('COUNT(*) OVER()')
-        ])
+            table.c.component_id
+        ]
+        if include_count:
+            columns.append(db.sql.expression.text('COUNT(*) OVER()'))
+        select_statement = db.select(columns)
 
         selectable = table
 
@@ -749,6 +741,36 @@ class VersionedJSONSerializableObjectTables(object):
         if offset is not None:
             select_statement = select_statement.offset(offset)
 
+        return select_statement
+
+    def get_current_objects(self, filter_func=lambda data: True, action_table=None, action_filter=None, connection=None, table=None, parameters=None, sorting_func=None, limit=None, offset=None, num_objects_found=None):
+        """
+        Queries and returns all objects matching a given filter.
+
+        :param filter_func: a lambda that may return an SQLAlchemy filter when given a table
+        :param action_filter: a SQLAlchemy comparator, used to query only objects created by specific actions
+        :param connection: the SQLAlchemy connection (optional, defaults to a new connection using self.bind)
+        :param table: a custom SQLAlchemy table-like object to use as base for the query (optional)
+        :param parameters: query parameters for the custom select statement (optional)
+        :return: a list of objects as object_type
+        """
+        if connection is None:
+            connection = self.bind.connect()
+
+        if parameters is None:
+            parameters = {}
+
+        select_statement = self._get_current_objects_select_statement(
+            filter_func=filter_func,
+            action_table=action_table,
+            action_filter=action_filter,
+            table=table,
+            sorting_func=sorting_func,
+            limit=limit,
+            offset=offset,
+            include_count=True
+        )
+
         objects = connection.execute(
             select_statement,
             **parameters
@@ -761,18 +783,81 @@ class VersionedJSONSerializableObjectTables(object):
                 num_objects_found.append(0)
         return [self.object_type(*obj[:-1]) for obj in objects]
 
-    def get_object_versions(self, object_id, connection=None):
+    def iter_current_objects(self, filter_func=lambda data: True, action_table=None, action_filter=None, connection=None, table=None, parameters=None, sorting_func=None, limit=None, offset=None, batch_size=500):
+        """
+        Queries all objects matching a given filter and yields them in batches
+        using a server-side cursor, so that they do not have to be loaded into
+        memory at once.
+
+        :param filter_func: a lambda that may return an SQLAlchemy filter when given a table
+        :param action_filter: a SQLAlchemy comparator, used to query only objects created by specific actions
+        :param connection: the SQLAlchemy connection (optional, defaults to a new connection using self.bind)
+        :param table: a custom SQLAlchemy table-like object to use as base for the query (optional)
+        :param parameters: query parameters for the custom select statement (optional)
+        :param batch_size: the number of rows to fetch from the cursor at a time
+        :return: an iterator yielding objects as object_type
+        """
+        if connection is None:
+            connection = self.bind.connect()
+
+        if parameters is None:
+            parameters = {}
+
+        select_statement = self._get_current_objects_select_statement(
+            filter_func=filter_func,
+            action_table=action_table,
+            action_filter=action_filter,
+            table=table,
+            sorting_func=sorting_func,
+            limit=limit,
+            offset=offset,
+            include_count=False
+        )
+
+        result = connection.execution_options(stream_results=True).execute(
+            select_statement,
+            **parameters
+        )
+        try:
+            for partition in result.partitions(batch_size):
+                for obj in partition:
+                    yield self.object_type(*obj)
+        finally:
+            result.close()
+
+    def get_object_versions(self, object_id, connection=None, load_data=True):
         """
         Queries and returns all versions of an object with a given ID, sorted ascendingly by the version ID, from first
         version to current version.
 
         :param object_id: the ID of the existing object
         :param connection: the SQLAlchemy connection (optional, defaults to a new connection using self.bind)
+        :param load_data: whether to load the data and schema of the versions, otherwise these will be None
         :return: a list of objects as object_type
         """
         if connection is None:
             connection = self.bind.connect()
-        current_object = self.get_current_object(object_id, connection=connection)
+        if load_data:
+            current_object = self.get_current_object(object_id, connection=connection)
+        else:
+            current_object = connection.execute(
+                db
+                .select([
+                    self._current_table.c.object_id,
+                    self._current_table.c.version_id,
+                    self._current_table.c.action_id,
+                    None,
+                    None,
+                    self._current_table.c.user_id,
+                    self._current_table.c.utc_datetime,
+                    self._current_table.c.fed_object_id,
+                    self._current_table.c.fed_version_id,
+                    self._current_table.c.component_id
+                ])
+                .where(self._current_table.c.object_id == object_id)
+            ).fetchone()
+            if current_object is not None:
+                current_object = self.object_type(*current_object)
         if current_object is None:
             return []
         previous_objects = connection.execute(
@@ -781,8 +866,8 @@ class VersionedJSONSerializableObjectTables(object):
                 self._previous_table.c.object_id,
                 self._previous_table.c.version_id,
                 self._previous_table.c.action_id,
-                self._previous_table.c.data,
-                self._previous_table.c.schema,
+                self._previous_table.c.data if load_data else None,
+                self._previous_table.c.schema if load_data else None,
                 self._previous_table.c.user_id,
                 self._previous_table.c.utc_datetime,
                 self._previous_table.c.fed_object_id,
@@ -835,3 +920,27 @@ class VersionedJSONSerializableObjectTables(object):
         if current_object is not None and current_object.version_id == version_id:
             return current_object
         return None
+
+    def get_object_version_data(self, object_id, version_id, connection=None):
+        """
+        Queries and returns the data of an individual version of an object, without its schema or other columns.
+
+        :param object_id: the ID of the existing object
+        :param version_id: the ID of the object's existing version
+        :param connection: the SQLAlchemy connection (optional, defaults to a new connection using self.bind)
+        :return: the object data or None if the object or this version of it does not exist or it has no data
+        """
+        if connection is None:
+            connection = self.bind.connect()
+        for table in (self._previous_table, self._current_table):
+            row = connection.execute(
+                db
+                .select([table.c.data])
+                .where(db.and_(
+                    table.c.object_id == object_id,
+                    table.c.version_id == version_id
+                ))
+            ).fetchone()
+            if row is not None:
+                return row.data
+        return None
@@ -7,7 +7,7 @@ Usage: python -m sampledb export_action_schema <action_id> <schema_file_name>
 
 import json
 import sys
-from .. import create_app
+from .. import create_app, db
 from ..logic.actions import get_action
 from ..logic.errors import ActionDoesNotExistError
 
@@ -31,6 +31,8 @@ def main(arguments):
             print('Error: no action with this id exists', file=sys.stderr)
             exit(1)
         schema = action.schema
+        # the script is done with the database, so close the pooled connections
+        db.engine.dispose()
     with open(schema_file_name, 'w') as schema_file:
         json.dump(schema, schema_file, indent=2)
     print("Success: the action schema has been exported to {}".format(schema_file_name))
@@ -525,7 +525,7 @@ This example shows how Markdown can be used for instrument Notes.
         sampledb.logic.location_permissions.set_location_permissions_for_all_users(room_42a.id, sampledb.logic.location_permissions.Permissions.WRITE)
         sampledb.logic.location_permissions.set_location_permissions_for_all_users(room_42b.id, sampledb.logic.location_permissions.Permissions.WRITE)
 
-        for object in sampledb.logic.objects.get_objects():
+        for object in sampledb.logic.objects.get_objects_iter():
             sampledb.logic.instrument_log_entries.create_instrument_log_object_attachment(
                 instrument_log_entry_id=log_entry.id,
                 object_id=object.id
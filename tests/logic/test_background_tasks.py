@@ -1,6 +1,60 @@
+import smtplib
+import time
+
+import pytest
+
 import sampledb.logic.background_tasks
 import sampledb.logic.background_tasks.core
-import time
+import sampledb.logic.background_tasks.send_mail
+
+
+class FakeSMTP:
+    def __init__(self, host, port):
+        self.sock = object()
+        self.sent_messages = []
+        self.quit_called = False
+        self.send_error = None
+        self.disconnect_on_quit = False
+
+    def set_debuglevel(self, level):
+        pass
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        if self.send_error is not None:
+            raise self.send_error
+        self.sent_messages.append(to_addrs)
+
+    def quit(self):
+        self.quit_called = True
+        self.sock = None
+        if self.disconnect_on_quit:
+            raise smtplib.SMTPServerDisconnected()
+
+
+@pytest.fixture
+def smtp_connections(app, monkeypatch):
+    smtp_connections = []
+
+    def create_smtp_connection(host, port):
+        smtp_connection = FakeSMTP(host, port)
+        smtp_connections.append(smtp_connection)
+        return smtp_connection
+
+    monkeypatch.setattr(smtplib, 'SMTP', create_smtp_connection)
+    monkeypatch.setattr(app.extensions['mail'], 'suppress', False)
+    app.config['ENABLE_BACKGROUND_TASKS'] = True
+    yield smtp_connections
+    sampledb.logic.background_tasks.send_mail.close_mail_connection()
+    app.config['ENABLE_BACKGROUND_TASKS'] = False
+
+
+def send_mail(recipient):
+    return sampledb.logic.background_tasks.send_mail.handle_send_mail_task({
+        'subject': 'Subject',
+        'recipients': [recipient],
+        'text': 'Text',
+        'html': '<p>Text</p>'
+    })
 
 
 def test_background_tasks(app):
@@ -50,3 +104,144 @@ def test_background_tasks(app):
     # stopped now
     sampledb.logic.background_tasks.stop_handler_threads(app)
     app.config['ENABLE_BACKGROUND_TASKS'] = False
+
+
+def test_background_task_batch(app, monkeypatch):
+    handler_call_args = []
+    def test_handler(data):
+        handler_call_args.append(data)
+        return data['value'] != 2
+
+    app.config['ENABLE_BACKGROUND_TASKS'] = False
+
+    sampledb.logic.background_tasks.core.HANDLERS['test'] = test_handler
+    results = sampledb.logic.background_tasks.post_background_task_batch('test', [{'value': 1}, {'value': 2}], False)
+    assert results == [
+        (sampledb.logic.background_tasks.core.BackgroundTaskStatus.DONE, None),
+        (sampledb.logic.background_tasks.core.BackgroundTaskStatus.FAILED, None)
+    ]
+    assert handler_call_args == [
+        {'value': 1},
+        {'value': 2}
+    ]
+    assert sampledb.logic.background_tasks.post_background_task_batch('test', [], False) == []
+
+    # handler threads may have been stopped by a previous test
+    monkeypatch.setattr(sampledb.logic.background_tasks.core, 'should_stop', False)
+    app.config['ENABLE_BACKGROUND_TASKS'] = True
+
+    handler_call_args.clear()
+    results = sampledb.logic.background_tasks.post_background_task_batch('test', [{'value': 1}, {'value': 2}, {'value': 3}], False)
+    assert [task_status for task_status, task in results] == [sampledb.logic.background_tasks.core.BackgroundTaskStatus.POSTED] * 3
+    # give the background tasks time to be processed
+    time.sleep(0.1)
+    task_ids = [task.id for task_status, task in results]
+    assert None not in task_ids
+    assert len(set(task_ids)) == 3
+    assert [
+        sampledb.logic.background_tasks.core.get_background_task(task_id).status
+        for task_id in task_ids
+    ] == [
+        sampledb.logic.background_tasks.core.BackgroundTaskStatus.DONE,
+        sampledb.logic.background_tasks.core.BackgroundTaskStatus.FAILED,
+        sampledb.logic.background_tasks.core.BackgroundTaskStatus.DONE
+    ]
+    # the tasks may be handled by different handler threads in any order
+    assert sorted(handler_call_args, key=lambda data: data['value']) == [
+        {'value': 1},
+        {'value': 2},
+        {'value': 3}
+    ]
+
+    sampledb.logic.background_tasks.stop_handler_threads(app)
+    app.config['ENABLE_BACKGROUND_TASKS'] = False
+
+
+def test_send_mail_reuses_connection(smtp_connections):
+    assert send_mail('a@example.com')
+    assert send_mail('b@example.com')
+    assert len(smtp_connections) == 1
+    assert smtp_connections[0].sent_messages == [['a@example.com'], ['b@example.com']]
+    assert not smtp_connections[0].quit_called
+    sampledb.logic.background_tasks.send_mail.close_mail_connection()
+    assert smtp_connections[0].quit_called
+    assert send_mail('c@example.com')
+    assert len(smtp_connections) == 2
+    assert smtp_connections[1].sent_messages == [['c@example.com']]
+
+
+def test_send_mail_reconnect(smtp_connections):
+    assert send_mail('a@example.com')
+    # the server closed the connection and smtplib noticed it
+    smtp_connections[0].sock = None
+    assert send_mail('b@example.com')
+    assert len(smtp_connections) == 2
+    assert smtp_connections[1].sent_messages == [['b@example.com']]
+
+
+def test_send_mail_retry(smtp_connections):
+    assert send_mail('a@example.com')
+    # the server closed the connection, but smtplib only notices it when sending
+    smtp_connections[0].send_error = smtplib.SMTPServerDisconnected()
+    assert send_mail('b@example.com')
+    assert len(smtp_connections) == 2
+    assert smtp_connections[0].sent_messages == [['a@example.com']]
+    assert smtp_connections[1].sent_messages == [['b@example.com']]
+
+
+def test_send_mail_retry_after_timeout(smtp_connections):
+    assert send_mail('a@example.com')
+    # the server closed the idle connection with a 421 reply, which is read
+    # as the reply to the MAIL command
+    smtp_connections[0].send_error = smtplib.SMTPSenderRefused(421, b'4.4.2 Error: timeout exceeded', 'sampledb@example.com')
+    assert send_mail('b@example.com')
+    assert len(smtp_connections) == 2
+    assert smtp_connections[0].sent_messages == [['a@example.com']]
+    assert smtp_connections[1].sent_messages == [['b@example.com']]
+
+
+def test_send_mail_refused(smtp_connections):
+    error = smtplib.SMTPRecipientsRefused({'a@example.com': (550, b'5.1.1 User unknown')})
+    assert send_mail('a@example.com')
+    smtp_connections[0].send_error = error
+    assert not send_mail('b@example.com')
+    # other errors are not retried
+    assert len(smtp_connections) == 1
+
+
+def test_send_mail_max_emails(app, smtp_connections, monkeypatch):
+    monkeypatch.setattr(app.extensions['mail'], 'max_emails', 2)
+    assert send_mail('a@example.com')
+    smtp_connections[0].disconnect_on_quit = True
+    assert send_mail('b@example.com')
+    # reaching the limit closes the connection, which must not cause the
+    # already delivered message to be sent again
+    assert len(smtp_connections) == 1
+    assert smtp_connections[0].quit_called
+    assert send_mail('c@example.com')
+    assert len(smtp_connections) == 2
+    assert smtp_connections[0].sent_messages == [['a@example.com'], ['b@example.com']]
+    assert smtp_connections[1].sent_messages == [['c@example.com']]
+
+
+def test_send_mail_handler_threads(app, smtp_connections, monkeypatch):
+    # handler threads may have been stopped by a previous test
+    monkeypatch.setattr(sampledb.logic.background_tasks.core, 'should_stop', False)
+    task_status, task = sampledb.logic.background_tasks.post_send_mail_task(
+        subject='Subject',
+        recipients=['a@example.com'],
+        text='Text',
+        html='<p>Text</p>',
+        auto_delete=False
+    )
+    assert task_status == sampledb.logic.background_tasks.core.BackgroundTaskStatus.POSTED
+    # give the background task time to be processed
+    time.sleep(0.1)
+    task = sampledb.logic.background_tasks.core.get_background_task(task.id)
+    assert task.status == sampledb.logic.background_tasks.core.BackgroundTaskStatus.DONE
+    assert len(smtp_connections) == 1
+    assert smtp_connections[0].sent_messages == [['a@example.com']]
+    # the connection is kept open by the handler thread until it is stopped
+    assert not smtp_connections[0].quit_called
+    sampledb.logic.background_tasks.stop_handler_threads(app)
+    assert smtp_connections[0].quit_called
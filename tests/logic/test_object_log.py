@@ -0,0 +1,233 @@
+# coding: utf-8
+"""
+
+"""
+
+import pytest
+import sampledb
+import sampledb.logic
+import sampledb.models
+from sampledb.models import ObjectLogEntry, ObjectLogEntryType
+
+
+@pytest.fixture
+def user():
+    user = sampledb.models.User(
+        name="User",
+        email="example@example.com",
+        type=sampledb.models.UserType.PERSON)
+    sampledb.db.session.add(user)
+    sampledb.db.session.commit()
+    return user
+
+
+@pytest.fixture
+def sample_action():
+    action = sampledb.logic.actions.create_action(
+        action_type_id=sampledb.models.ActionType.SAMPLE_CREATION,
+        schema={
+            'title': 'Sample',
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'title': 'Name',
+                    'type': 'text'
+                },
+                'sample': {
+                    'title': 'Sample',
+                    'type': 'sample'
+                }
+            },
+            'required': ['name']
+        }
+    )
+    return action
+
+
+@pytest.fixture
+def measurement_action():
+    action = sampledb.logic.actions.create_action(
+        action_type_id=sampledb.models.ActionType.MEASUREMENT,
+        schema={
+            'title': 'Measurement',
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'title': 'Name',
+                    'type': 'text'
+                },
+                'sample': {
+                    'title': 'Sample',
+                    'type': 'sample'
+                },
+                'samples': {
+                    'title': 'Samples',
+                    'type': 'array',
+                    'items': {
+                        'title': 'Sample',
+                        'type': 'sample'
+                    }
+                },
+                'reference': {
+                    'title': 'Reference',
+                    'type': 'object_reference'
+                }
+            },
+            'required': ['name']
+        }
+    )
+    return action
+
+
+def get_log_entries(object_id):
+    return [
+        (log_entry.type, log_entry.user_id, log_entry.data)
+        for log_entry in ObjectLogEntry.query.filter_by(object_id=object_id).order_by(ObjectLogEntry.id).all()
+    ]
+
+
+def test_reference_log_entries(user, sample_action, measurement_action):
+    samples = [
+        sampledb.logic.objects.create_object(
+            action_id=sample_action.id,
+            data={
+                'name': {
+                    '_type': 'text',
+                    'text': 'Sample {}'.format(i)
+                }
+            },
+            user_id=user.id
+        )
+        for i in range(3)
+    ]
+    measurement = sampledb.logic.objects.create_object(
+        action_id=measurement_action.id,
+        data={
+            'name': {
+                '_type': 'text',
+                'text': 'Measurement'
+            },
+            'sample': {
+                '_type': 'sample',
+                'object_id': samples[0].id
+            },
+            'samples': [
+                {
+                    '_type': 'sample',
+                    'object_id': samples[0].id
+                },
+                {
+                    '_type': 'sample',
+                    'object_id': samples[1].id
+                }
+            ],
+            'reference': {
+                '_type': 'object_reference',
+                'object_id': samples[2].id
+            }
+        },
+        user_id=user.id
+    )
+    create_object_log_entry = (ObjectLogEntryType.CREATE_OBJECT, user.id, {})
+    use_object_in_measurement_log_entry = (ObjectLogEntryType.USE_OBJECT_IN_MEASUREMENT, user.id, {'measurement_id': measurement.id})
+    reference_object_in_metadata_log_entry = (ObjectLogEntryType.REFERENCE_OBJECT_IN_METADATA, user.id, {'object_id': measurement.id})
+    assert get_log_entries(measurement.id) == [create_object_log_entry]
+    assert get_log_entries(samples[0].id) == [
+        create_object_log_entry,
+        use_object_in_measurement_log_entry,
+        use_object_in_measurement_log_entry
+    ]
+    assert get_log_entries(samples[1].id) == [
+        create_object_log_entry,
+        use_object_in_measurement_log_entry
+    ]
+    assert get_log_entries(samples[2].id) == [
+        create_object_log_entry,
+        reference_object_in_metadata_log_entry
+    ]
+
+    sampledb.logic.objects.update_object(
+        object_id=measurement.id,
+        data={
+            'name': {
+                '_type': 'text',
+                'text': 'Measurement'
+            },
+            'sample': {
+                '_type': 'sample',
+                'object_id': samples[1].id
+            },
+            'samples': [
+                {
+                    '_type': 'sample',
+                    'object_id': samples[0].id
+                },
+                {
+                    '_type': 'sample',
+                    'object_id': samples[1].id
+                }
+            ],
+            'reference': {
+                '_type': 'object_reference',
+                'object_id': samples[2].id
+            }
+        },
+        user_id=user.id
+    )
+    # only the changed reference leads to a new log entry
+    assert get_log_entries(measurement.id) == [
+        create_object_log_entry,
+        (ObjectLogEntryType.EDIT_OBJECT, user.id, {'version_id': 1})
+    ]
+    assert get_log_entries(samples[0].id) == [
+        create_object_log_entry,
+        use_object_in_measurement_log_entry,
+        use_object_in_measurement_log_entry
+    ]
+    assert get_log_entries(samples[1].id) == [
+        create_object_log_entry,
+        use_object_in_measurement_log_entry,
+        use_object_in_measurement_log_entry
+    ]
+    assert get_log_entries(samples[2].id) == [
+        create_object_log_entry,
+        reference_object_in_metadata_log_entry
+    ]
+
+    sample = sampledb.logic.objects.create_object(
+        action_id=sample_action.id,
+        data={
+            'name': {
+                '_type': 'text',
+                'text': 'Sample'
+            },
+            'sample': {
+                '_type': 'sample',
+                'object_id': samples[2].id
+            }
+        },
+        user_id=user.id
+    )
+    assert get_log_entries(samples[2].id) == [
+        create_object_log_entry,
+        reference_object_in_metadata_log_entry,
+        (ObjectLogEntryType.USE_OBJECT_IN_SAMPLE_CREATION, user.id, {'sample_id': sample.id})
+    ]
+
+
+def test_store_log_entries_without_objects(user, sample_action):
+    sample = sampledb.logic.objects.create_object(
+        action_id=sample_action.id,
+        data={
+            'name': {
+                '_type': 'text',
+                'text': 'Sample'
+            }
+        },
+        user_id=user.id
+    )
+    number_of_log_entries = ObjectLogEntry.query.count()
+    sampledb.logic.object_log.use_objects_in_measurement(user_id=user.id, object_ids=[], measurement_id=sample.id)
+    sampledb.logic.object_log.use_objects_in_sample(user_id=user.id, object_ids=[], sample_id=sample.id)
+    sampledb.logic.object_log.reference_objects_in_metadata(user_id=user.id, object_ids=[], referencing_object_id=sample.id)
+    assert ObjectLogEntry.query.count() == number_of_log_entries
@@ -168,6 +168,19 @@ def test_get_objects(user, action) -> None:
     assert current_objects == [object1, object2] or current_objects == [object2, object1]
 
 
+def test_get_objects_iter(user, action) -> None:
+    data = {
+        'name': {
+            '_type': 'text',
+            'text': 'Example'
+        }
+    }
+    object1 = sampledb.logic.objects.create_object(action_id=action.id, data=data, user_id=user.id)
+    object2 = sampledb.logic.objects.create_object(action_id=action.id, data=data, user_id=user.id)
+    current_objects = list(sampledb.logic.objects.get_objects_iter(batch_size=1))
+    assert current_objects == [object1, object2] or current_objects == [object2, object1]
+
+
 def test_get_objects_action_filter(user, action) -> None:
     action1 = action
     action2 = sampledb.logic.actions.create_action(
@@ -464,6 +477,168 @@ def test_measurement_referencing_sample(flask_server, user) -> None:
     assert len(object_log_entries) == 3
 
 
+def test_find_references(user, user2, action) -> None:
+    samples = [
+        sampledb.logic.objects.create_object(
+            action_id=action.id,
+            data={
+                'name': {
+                    '_type': 'text',
+                    'text': 'Sample {}'.format(i)
+                }
+            },
+            user_id=user.id
+        )
+        for i in range(3)
+    ]
+    referencing_action = sampledb.logic.actions.create_action(
+        action_type_id=sampledb.models.ActionType.SAMPLE_CREATION,
+        schema={
+            'title': 'Example Object',
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'title': 'Object Name',
+                    'type': 'text'
+                },
+                'sample': {
+                    'title': 'Sample',
+                    'type': 'sample'
+                },
+                'samples': {
+                    'title': 'Samples',
+                    'type': 'array',
+                    'items': {
+                        'title': 'Sample',
+                        'type': 'sample'
+                    }
+                },
+                'reference': {
+                    'title': 'Reference',
+                    'type': 'object_reference'
+                },
+                'operator': {
+                    'title': 'Operator',
+                    'type': 'user'
+                },
+                'supervisor': {
+                    'title': 'Supervisor',
+                    'type': 'user'
+                }
+            },
+            'required': ['name']
+        }
+    )
+    object = sampledb.logic.objects.create_object(
+        action_id=referencing_action.id,
+        data={
+            'name': {
+                '_type': 'text',
+                'text': 'Object'
+            },
+            'sample': {
+                '_type': 'sample',
+                'object_id': samples[0].id
+            },
+            'samples': [
+                {
+                    '_type': 'sample',
+                    'object_id': samples[0].id
+                },
+                {
+                    '_type': 'sample',
+                    'object_id': samples[1].id
+                }
+            ],
+            'operator': {
+                '_type': 'user',
+                'user_id': user.id
+            },
+            'supervisor': {
+                '_type': 'user',
+                'user_id': user.id
+            }
+        },
+        user_id=user.id
+    )
+    assert sorted(sampledb.logic.objects.find_object_references(object), key=str) == sorted([
+        (samples[0].id, None, 'sample'),
+        (samples[0].id, None, 'sample'),
+        (samples[1].id, None, 'sample')
+    ], key=str)
+    assert sampledb.logic.objects.find_user_references(object) == [
+        (user.id, None),
+        (user.id, None)
+    ]
+
+    sampledb.logic.objects.update_object(
+        object_id=object.id,
+        data={
+            'name': {
+                '_type': 'text',
+                'text': 'Object'
+            },
+            'sample': {
+                '_type': 'sample',
+                'object_id': samples[1].id
+            },
+            'samples': [
+                {
+                    '_type': 'sample',
+                    'object_id': samples[0].id
+                },
+                {
+                    '_type': 'sample',
+                    'object_id': samples[2].id
+                },
+                {
+                    '_type': 'sample',
+                    'object_id': samples[1].id
+                }
+            ],
+            'reference': {
+                '_type': 'object_reference',
+                'object_id': samples[2].id
+            },
+            'operator': {
+                '_type': 'user',
+                'user_id': user2.id
+            },
+            'supervisor': {
+                '_type': 'user',
+                'user_id': user.id
+            }
+        },
+        user_id=user.id
+    )
+    object = sampledb.logic.objects.get_object(object.id)
+    assert object.version_id == 1
+    # changed, unchanged and new references, including array items and
+    # properties that did not exist in the previous version
+    assert sorted(sampledb.logic.objects.find_object_references(object), key=str) == sorted([
+        (samples[1].id, samples[0].id, 'sample'),
+        (samples[0].id, samples[0].id, 'sample'),
+        (samples[2].id, samples[1].id, 'sample'),
+        (samples[1].id, None, 'sample'),
+        (samples[2].id, None, 'object_reference')
+    ], key=str)
+    assert sorted(sampledb.logic.objects.find_object_references(object, find_previous_referenced_object_ids=False), key=str) == sorted([
+        (samples[1].id, None, 'sample'),
+        (samples[0].id, None, 'sample'),
+        (samples[2].id, None, 'sample'),
+        (samples[1].id, None, 'sample'),
+        (samples[2].id, None, 'object_reference')
+    ], key=str)
+    assert sorted(sampledb.logic.objects.find_user_references(object), key=str) == sorted([
+        (user2.id, user.id),
+        (user.id, user.id)
+    ], key=str)
+    assert sorted(sampledb.logic.objects.find_user_references(object, find_previous_referenced_user_ids=False), key=str) == sorted([
+        (user2.id, None),
+        (user.id, None)
+    ], key=str)
+
+
 def test_update_object_version(user, action, user2, component) -> None:
     data = {
         'name': {
@@ -172,6 +172,21 @@ def test_get_current_objects_action_filter(session: sessionmaker(), objects: Ver
     assert current_objects == [object1]
 
 
+def test_iter_current_objects(session: sessionmaker(), objects: VersionedJSONSerializableObjectTables) -> None:
+    user = User(id=0, name="User")
+    session.add(user)
+    action = Action(id=0, schema={})
+    session.add(action)
+    session.commit()
+    created_objects = [
+        objects.create_object(action_id=action.id, data={}, schema={}, user_id=user.id)
+        for _ in range(5)
+    ]
+    current_objects = list(objects.iter_current_objects(batch_size=2))
+    assert current_objects == objects.get_current_objects()
+    assert sorted(current_objects, key=lambda obj: obj.object_id) == created_objects
+
+
 def test_get_current_object(session: sessionmaker(), objects: VersionedJSONSerializableObjectTables) -> None:
     user = User(id=0, name="User")
     session.add(user)
@@ -199,6 +214,22 @@ def test_get_object_versions(session: sessionmaker(), objects: VersionedJSONSeri
     assert object_versions == [object1, object2]
 
 
+def test_get_object_versions_without_data(session: sessionmaker(), objects: VersionedJSONSerializableObjectTables) -> None:
+    user = User(name="User")
+    session.add(user)
+    action = Action(id=0, schema={})
+    session.add(action)
+    session.commit()
+    object1 = objects.create_object(action_id=action.id, data={}, schema={}, user_id=user.id)
+    object2 = objects.update_object(object1.object_id, data={'test': 1}, schema={}, user_id=user.id)
+    object_versions = objects.get_object_versions(object1.object_id, load_data=False)
+    assert object_versions == [
+        object1._replace(data=None, schema=None),
+        object2._replace(data=None, schema=None)
+    ]
+    assert objects.get_object_versions(0, load_data=False) == []
+
+
 def test_get_object_versions_errors(session: sessionmaker(), objects: VersionedJSONSerializableObjectTables) -> None:
     object_versions = objects.get_object_versions(0)
     assert object_versions == []
@@ -223,6 +254,20 @@ def test_get_object_version(session: sessionmaker(), objects: VersionedJSONSeria
     assert object_version3 is None
 
 
+def test_get_object_version_data(session: sessionmaker(), objects: VersionedJSONSerializableObjectTables) -> None:
+    user = User(name="User")
+    session.add(user)
+    action = Action(id=0, schema={})
+    session.add(action)
+    session.commit()
+    object1 = objects.create_object(action_id=action.id, data={'a': [{'b': 1}, {'b': 2}]}, schema={}, user_id=user.id)
+    objects.update_object(object1.object_id, data={'a': [{'b': 3}]}, schema={}, user_id=user.id)
+    assert objects.get_object_version_data(object1.object_id, 0) == {'a': [{'b': 1}, {'b': 2}]}
+    assert objects.get_object_version_data(object1.object_id, 1) == {'a': [{'b': 3}]}
+    assert objects.get_object_version_data(object1.object_id, 2) is None
+    assert objects.get_object_version_data(object1.object_id + 1, 0) is None
+
+
 def test_create_object_invalid_schema(session: sessionmaker(), objects: VersionedJSONSerializableObjectTables) -> None:
     user = User(id=0, name="User")
     session.add(user)